@@ -1,6 +1,7 @@
 """
 Cached helper methods for all operations that are called often
 """
+
 from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple, cast
 
@@ -55,30 +56,18 @@ def get_table_nesting_level(
     return default_nesting
 
 
-@lru_cache(maxsize=None)
 def get_primary_key(schema: Schema, table_name: str) -> List[str]:
+    """Gets primary key columns of `table_name`. Not cached, reflects current content of the schema"""
     if table_name not in schema.tables:
         return []
     table = schema.get_table(table_name)
     return get_columns_names_with_prop(table, "primary_key", include_incomplete=True)
 
 
-@lru_cache(maxsize=None)
-def is_nested_type(
-    schema: Schema,
-    table_name: str,
-    field_name: str,
-    _r_lvl: int,
-) -> bool:
-    """For those paths the nested objects should be left in place.
-    Cache perf: max_nesting < _r_lvl: ~2x faster, full check 10x faster
+def is_json_type(schema: Schema, table_name: str, field_name: str) -> bool:
+    """Checks if `field_name` in `table_name` has or is inferred to have json data type. Not cached,
+    so it reflects the current content of the schema.
     """
-
-    # nesting level is counted backwards
-    # is we have traversed to or beyond the calculated nesting level, we detect a nested type
-    if _r_lvl <= 0:
-        return True
-
     column: TColumnSchema = None
     table = schema.tables.get(table_name)
     if table:
@@ -128,14 +117,20 @@ def get_row_hash(row: Dict[str, Any], subset: Optional[List[str]] = None) -> str
     Excludes dlt system columns.
     Can be used as deterministic row identifier.
     """
-    row_filtered = {k: v for k, v in row.items() if not k.startswith(DLT_NAME_PREFIX)}
     if subset is not None:
-        row_filtered = {k: v for k, v in row.items() if k in subset}
+        row_filtered = {k: row[k] for k in subset if k in row}
+    else:
+        row_filtered = {k: v for k, v in row.items() if not k.startswith(DLT_NAME_PREFIX)}
     row_str = json.dumps(row_filtered, sort_keys=True)
     return digest128(row_str, DLT_ID_LENGTH_BYTES)
 
 
 def get_nested_row_hash(parent_row_id: str, nested_table: str, list_idx: int) -> str:
+    """Returns deterministic id of a nested row.
+
+    The id is stored in `_dlt_id` of nested tables and used to merge them (ie. `upsert` and `scd2`)
+    so the hash function and its input must stay stable across dlt versions.
+    """
     # create deterministic unique id of the nested row taking into account that all lists are ordered
     # and all nested tables must be lists
     return digest128(f"{parent_row_id}_{nested_table}_{list_idx}", DLT_ID_LENGTH_BYTES)
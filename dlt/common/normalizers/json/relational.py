@@ -1,6 +1,7 @@
 from typing import (
     ClassVar,
     Dict,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -69,6 +70,10 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
     propagation_config: RelationalNormalizerConfigPropagation
     max_nesting: int
     _skip_primary_key: Dict[str, bool]
+    _normalized_identifiers: Dict[str, str]
+    _normalized_table_identifiers: Dict[str, str]
+    _nested_types: Dict[str, Dict[str, bool]]
+    _primary_keys: Dict[str, List[str]]
 
     def __init__(self, schema: Schema) -> None:
         """This item normalizer works with nested dictionaries. It flattens dictionaries and descends into lists.
@@ -100,6 +105,13 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         self.propagation_config = self.normalizer_config.get("propagation", None)
         self.max_nesting = self.normalizer_config.get("max_nesting", 1000)
         self._skip_primary_key = {}
+        # normalized data keys, naming convention does not change for the lifetime of this instance
+        self._normalized_identifiers = {}
+        self._normalized_table_identifiers = {}
+        # json type flags of fields per table, dropped when table changes in the schema
+        self._nested_types = {}
+        # primary key columns per table, dropped when table changes in the schema
+        self._primary_keys = {}
         # self.known_types: Dict[str, TDataType] = {}
         # self.primary_keys = Dict[str, ]
 
@@ -108,42 +120,103 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
     ) -> Tuple[DictStrAny, Dict[Tuple[str, ...], Sequence[Any]]]:
         out_rec_row: DictStrAny = {}
         out_rec_list: Dict[Tuple[str, ...], Sequence[Any]] = {}
+        # bind attributes and helpers used for every key to locals
+        normalized_identifiers = self._normalized_identifiers
+        shorten_fragments = helpers.shorten_fragments
+        is_nested_type = self._is_nested_type
+        naming = self.naming
 
-        def norm_row_dicts(dict_row: StrAny, __r_lvl: int, path: Tuple[str, ...] = ()) -> None:
-            for k, v in dict_row.items():
-                if k.strip():
-                    norm_k = helpers.normalize_identifier(self.schema, self.naming, k)
-                else:
-                    # for empty keys in the data use _
-                    norm_k = self.EMPTY_KEY_IDENTIFIER
+        # fast path: rows without nested values or rows at max nesting level (where all nested
+        # values are kept in place) and with all keys seen before are flattened with a single
+        # dict comprehension
+        has_nested = False
+        if _r_lvl > 0:
+            for v in dict_row.values():
+                if isinstance(v, dict) or isinstance(v, list):
+                    has_nested = True
+                    break
+        if not has_nested:
+            try:
+                return {normalized_identifiers[k]: v for k, v in dict_row.items()}, out_rec_list
+            except KeyError:
+                # new keys must be normalized first
+                pass
+
+        # walk nested dicts depth first with an explicit stack of item iterators instead of
+        # recursion, this keeps the order of flattened columns and avoids a frame per nested dict
+        stack: List[Tuple[Iterator[Tuple[str, Any]], int, Tuple[str, ...]]] = [
+            (iter(dict_row.items()), _r_lvl, ())
+        ]
+        while stack:
+            items, __r_lvl, path = stack[-1]
+            # at max nesting level all dicts and lists are kept in place without type checks
+            may_descend = __r_lvl > 0
+            for k, v in items:
+                norm_k = normalized_identifiers.get(k)
+                if norm_k is None:
+                    if k.strip():
+                        norm_k = helpers.normalize_identifier(self.schema, naming, k)
+                    else:
+                        # for empty keys in the data use _
+                        norm_k = self.EMPTY_KEY_IDENTIFIER
+                    normalized_identifiers[k] = norm_k
                 # if norm_k != k:
                 #     print(f"{k} -> {norm_k}")
-                nested_name = (
-                    norm_k if path == () else helpers.shorten_fragments(self.naming, *path, norm_k)
-                )
+                nested_name = norm_k if path == () else shorten_fragments(naming, *path, norm_k)
                 # for lists and dicts we must check if type is possibly nested
-                if isinstance(v, (dict, list)):
-                    if not helpers.is_nested_type(self.schema, table, nested_name, __r_lvl):
+                # NOTE: separate isinstance checks are cheaper than a check against a tuple of types
+                if isinstance(v, dict):
+                    if may_descend and not is_nested_type(table, nested_name):
+                        # flatten the dict more, resume current dict when nested one is exhausted
+                        stack.append((iter(v.items()), __r_lvl - 1, path + (norm_k,)))
+                        break
+                elif isinstance(v, list):
+                    if may_descend and not is_nested_type(table, nested_name):
                         # TODO: if schema contains table {table}__{nested_name} then convert v into single element list
-                        if isinstance(v, dict):
-                            # flatten the dict more
-                            norm_row_dicts(v, __r_lvl - 1, path + (norm_k,))
-                        else:
-                            # pass the list to out_rec_list
-                            out_rec_list[
-                                path
-                                + (helpers.normalize_table_identifier(self.schema, self.naming, k),)
-                            ] = v
+                        # pass the list to out_rec_list
+                        out_rec_list[path + (self._normalize_table_identifier(k),)] = v
                         continue
-                    else:
-                        # pass the nested value to out_rec_row
-                        pass
 
+                # pass the value or the nested value to out_rec_row
                 out_rec_row[nested_name] = v
+            else:
+                stack.pop()
 
-        norm_row_dicts(dict_row, _r_lvl)
         return out_rec_row, out_rec_list
 
+    def _is_nested_type(self, table: str, field_name: str) -> bool:
+        """Tells if value of `field_name` should be left in place. Caches json type flags per table.
+        Nesting level is checked by the caller.
+        """
+        nested_types = self._nested_types.get(table)
+        if nested_types is None:
+            nested_types = self._nested_types[table] = {}
+        is_nested = nested_types.get(field_name)
+        if is_nested is None:
+            is_nested = nested_types[field_name] = helpers.is_json_type(
+                self.schema, table, field_name
+            )
+        return is_nested
+
+    def _get_primary_key(self, table: str) -> List[str]:
+        primary_key = self._primary_keys.get(table)
+        if primary_key is None:
+            primary_key = self._primary_keys[table] = helpers.get_primary_key(self.schema, table)
+        return primary_key
+
+    def _drop_table_caches(self, table_name: str) -> None:
+        self._nested_types.pop(table_name, None)
+        self._primary_keys.pop(table_name, None)
+
+    def _normalize_table_identifier(self, table_name: str) -> str:
+        norm_table_name = self._normalized_table_identifiers.get(table_name)
+        if norm_table_name is None:
+            norm_table_name = helpers.normalize_table_identifier(
+                self.schema, self.naming, table_name
+            )
+            self._normalized_table_identifiers[table_name] = norm_table_name
+        return norm_table_name
+
     def _link_row(self, row: DictStrAny, parent_row_id: str, list_idx: int) -> DictStrAny:
         assert parent_row_id
         row[self.c_dlt_parent_id] = parent_row_id
@@ -151,10 +224,6 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
 
         return row
 
-    @staticmethod
-    def _extend_row(extend: DictStrAny, row: DictStrAny) -> None:
-        row.update(extend)
-
     def _add_row_id(
         self,
         table: str,
@@ -169,7 +238,7 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
             if row_id_type in ("key_hash", "row_hash"):
                 subset = None
                 if row_id_type == "key_hash":
-                    subset = helpers.get_primary_key(self.schema, table)
+                    subset = self._get_primary_key(table)
                 # base hash on `dict_row` instead of `flattened_row`
                 # so changes in nested tables lead to new row id
                 row_id = helpers.get_row_hash(dict_row, subset=subset)
@@ -198,8 +267,10 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
             mappings: Dict[TColumnName, TColumnName] = {}
             if is_root:
                 mappings.update(config.get("root") or {})
-            if table in (config.get("tables") or {}):
-                mappings.update(config["tables"][table])
+            # single lookup of table mappings, this runs for every row of tables with propagation
+            table_mappings = (config.get("tables") or {}).get(table)
+            if table_mappings:
+                mappings.update(table_mappings)
             # look for keys and create propagation as values
             for prop_from, prop_as in mappings.items():
                 if prop_from in row:
@@ -207,42 +278,6 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
 
         return extend
 
-    # generate nested tables only for lists
-    def _normalize_list(
-        self,
-        seq: Sequence[Any],
-        extend: DictStrAny,
-        ident_path: Tuple[str, ...],
-        parent_path: Tuple[str, ...],
-        parent_row_id: Optional[str] = None,
-        _r_lvl: int = 0,
-    ) -> TNormalizedRowIterator:
-        table = helpers.shorten_fragments(self.naming, *parent_path, *ident_path)
-
-        for idx, v in enumerate(seq):
-            if isinstance(v, dict):
-                # found dict element in seq
-                yield from self._normalize_row(
-                    v, extend, ident_path, parent_path, parent_row_id, idx, _r_lvl
-                )
-            elif isinstance(v, list):
-                # to normalize lists of lists, we must create a tracking intermediary table by creating a mock row
-                yield from self._normalize_row(
-                    {"list": v},
-                    extend,
-                    ident_path,
-                    parent_path,
-                    parent_row_id,
-                    idx,
-                    _r_lvl - 1,
-                )
-            else:
-                # found non-dict in seq, so wrap it
-                wrap_v = wrap_in_dict(self.c_value, v)
-                DataItemNormalizer._extend_row(extend, wrap_v)
-                self._add_row_id(table, wrap_v, wrap_v, parent_row_id, idx)
-                yield (table, helpers.shorten_fragments(self.naming, *parent_path)), wrap_v
-
     def _normalize_row(
         self,
         dict_row: DictStrAny,
@@ -255,37 +290,131 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         is_root: bool = False,
     ) -> TNormalizedRowIterator:
         naming = self.naming
-        table = helpers.shorten_fragments(naming, *parent_path, *ident_path)
-        # flatten current row and extract all lists to recur into
-        flattened_row, lists = self._flatten(table, dict_row, _r_lvl)
-        # always extend row
-        DataItemNormalizer._extend_row(extend, flattened_row)
-        # infer record hash or leave existing primary key if present
-        row_id = flattened_row.get(self.c_dlt_id, None)
-        if not row_id:
-            row_id = self._add_row_id(table, dict_row, flattened_row, parent_row_id, pos, is_root)
-
-        # find fields to propagate to nested tables in config
-        extend.update(self._get_propagated_values(table, flattened_row, is_root))
-
-        # yield parent table first
-        should_descend = yield (
-            (table, helpers.shorten_fragments(naming, *parent_path)),
-            flattened_row,
-        )
-        if should_descend is False:
-            return
-
-        # normalize and yield lists
-        for list_path, list_content in lists.items():
-            yield from self._normalize_list(
-                list_content,
-                extend,
-                list_path,
-                parent_path + ident_path,
-                row_id,
-                _r_lvl - 1,
+        shorten_fragments = helpers.shorten_fragments
+        path = parent_path + ident_path
+        # rows still to be visited, popped from the end so nested rows are yielded depth first
+        # each frame is (row, path, table, parent_table, parent_row_id, pos, _r_lvl, is_root, is_value)
+        # table names are computed once per list and passed to all its elements
+        stack: List[
+            Tuple[
+                DictStrAny,
+                Tuple[str, ...],
+                str,
+                Optional[str],
+                Optional[str],
+                Optional[int],
+                int,
+                bool,
+                bool,
+            ]
+        ] = [
+            (
+                dict_row,
+                path,
+                shorten_fragments(naming, *path),
+                shorten_fragments(naming, *parent_path),
+                parent_row_id,
+                pos,
+                _r_lvl,
+                is_root,
+                False,
             )
+        ]
+
+        while stack:
+            (
+                dict_row,
+                path,
+                table,
+                parent_table,
+                parent_row_id,
+                pos,
+                _r_lvl,
+                is_root,
+                is_value,
+            ) = stack.pop()
+
+            if is_value:
+                # non-dict element of a list already wrapped in a dict
+                if extend:
+                    dict_row.update(extend)
+                self._add_row_id(table, dict_row, dict_row, parent_row_id, pos)
+                yield (table, parent_table), dict_row
+                continue
+
+            # flatten current row and extract all lists to descend into
+            flattened_row, lists = self._flatten(table, dict_row, _r_lvl)
+            # always extend row, skip the update when nothing is propagated
+            if extend:
+                flattened_row.update(extend)
+            # infer record hash or leave existing primary key if present
+            row_id = flattened_row.get(self.c_dlt_id, None)
+            if not row_id:
+                row_id = self._add_row_id(
+                    table, dict_row, flattened_row, parent_row_id, pos, is_root
+                )
+
+            # find fields to propagate to nested tables in config
+            if self.propagation_config:
+                extend.update(self._get_propagated_values(table, flattened_row, is_root))
+
+            # yield parent table first
+            should_descend = yield (table, parent_table), flattened_row
+            # rows without nested lists (the common case) have no nested tables to generate
+            if should_descend is False or not lists:
+                continue
+
+            # generate nested tables only for lists, push in reverse so they are visited in order
+            for list_path, list_content in reversed(lists.items()):
+                nested_path = path + list_path
+                nested_table = shorten_fragments(naming, *nested_path)
+                for idx in range(len(list_content) - 1, -1, -1):
+                    v = list_content[idx]
+                    if isinstance(v, dict):
+                        # found dict element in seq
+                        stack.append(
+                            (
+                                v,
+                                nested_path,
+                                nested_table,
+                                table,
+                                row_id,
+                                idx,
+                                _r_lvl - 1,
+                                False,
+                                False,
+                            )
+                        )
+                    elif isinstance(v, list):
+                        # to normalize lists of lists, we must create a tracking intermediary table by creating a mock row
+                        stack.append(
+                            (
+                                {"list": v},
+                                nested_path,
+                                nested_table,
+                                table,
+                                row_id,
+                                idx,
+                                _r_lvl - 2,
+                                False,
+                                False,
+                            )
+                        )
+                    else:
+                        # found non-dict in seq, so wrap it
+                        stack.append(
+                            (
+                                wrap_in_dict(self.c_value, v),
+                                nested_path,
+                                nested_table,
+                                table,
+                                row_id,
+                                idx,
+                                _r_lvl - 1,
+                                False,
+                                True,
+                            )
+                        )
 
     def extend_schema(self) -> None:
         """Extends Schema with normalizer-specific hints and settings.
@@ -325,6 +454,8 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         Called by Schema when new table is added to schema or table is updated with partial table.
         Table name should be normalized.
         """
+        # columns of the table may have changed
+        self._drop_table_caches(table_name)
         table = self.schema.tables.get(table_name)
         # add root key prop when merge disposition is used or any of nested tables needs row_key
         if not is_nested_table(table) and (
@@ -353,6 +484,7 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
 
     def remove_table(self, table_name: str) -> None:
         """Called by the Schema when table is removed from it."""
+        self._drop_table_caches(table_name)
         config = self.get_normalizer_config(self.schema)
         if propagation := config.get("propagation"):
             if tables := propagation.get("tables"):
@@ -365,11 +497,11 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         if not isinstance(item, dict):
             item = wrap_in_dict(self.c_value, item)
         # we will extend event with all the fields necessary to load it as root row
-        row = cast(DictStrAny, item)
+        row: DictStrAny = item
         # identify load id if loaded data must be processed after loading incrementally
         row[self.c_dlt_load_id] = load_id
         # get table name and nesting level
-        root_table_name = helpers.normalize_table_identifier(self.schema, self.naming, table_name)
+        root_table_name = self._normalize_table_identifier(table_name)
         max_nesting = helpers.get_table_nesting_level(
             self.schema, root_table_name, self.max_nesting
         )
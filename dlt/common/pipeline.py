@@ -131,7 +131,7 @@ class StepInfo(SupportsHumanize, Generic[TStepMetricsCo]):
 
     @staticmethod
     def _load_packages_asstr(load_packages: List[LoadPackageInfo], verbosity: int) -> str:
-        msg: str = ""
+        msg: List[str] = []
         for load_package in load_packages:
             cstr = (
                 load_package.state.upper()
@@ -142,16 +142,16 @@ class StepInfo(SupportsHumanize, Generic[TStepMetricsCo]):
             # complete but failed job will not raise any exceptions
             failed_jobs = load_package.jobs["failed_jobs"]
             jobs_str = "no failed jobs" if not failed_jobs else f"{len(failed_jobs)} FAILED job(s)!"
-            msg += f"\nLoad package {load_package.load_id} is {cstr} and contains {jobs_str}"
-            if verbosity > 0:
+            msg.append(f"\nLoad package {load_package.load_id} is {cstr} and contains {jobs_str}")
+            if verbosity > 0 and failed_jobs:
                 for failed_job in failed_jobs:
-                    msg += (
+                    msg.append(
                         f"\n\t[{failed_job.job_file_info.job_id()}]: {failed_job.failed_message}\n"
                     )
             if verbosity > 1:
-                msg += "\nPackage details:\n"
-                msg += load_package.asstr() + "\n"
-        return msg
+                msg.append("\nPackage details:\n")
+                msg.append(load_package.asstr() + "\n")
+        return "".join(msg)
 
     @staticmethod
     def writer_metrics_asdict(
@@ -294,14 +294,13 @@ class NormalizeInfo(StepInfo[NormalizeMetrics], _NormalizeInfo):  # type: ignore
         return d
 
     def asstr(self, verbosity: int = 0) -> str:
-        if self.row_counts:
-            msg = "Normalized data for the following tables:\n"
-            for key, value in self.row_counts.items():
-                msg += f"- {key}: {value} row(s)\n"
+        if row_counts := self.row_counts:
+            msg = ["Normalized data for the following tables:\n"]
+            msg.extend(f"- {key}: {value} row(s)\n" for key, value in row_counts.items())
         else:
-            msg = "No data found to normalize"
-        msg += self._load_packages_asstr(self.load_packages, verbosity)
-        return msg
+            msg = ["No data found to normalize"]
+        msg.append(self._load_packages_asstr(self.load_packages, verbosity))
+        return "".join(msg)
 
 
 class _LoadInfo(NamedTuple):
@@ -343,29 +342,29 @@ class LoadInfo(StepInfo[LoadMetrics], _LoadInfo):  # type: ignore[misc]
         return d
 
     def asstr(self, verbosity: int = 0) -> str:
-        msg = f"Pipeline {self.pipeline.pipeline_name} load step completed in "
+        msg = [f"Pipeline {self.pipeline.pipeline_name} load step completed in "]
         if self.started_at:
             elapsed = self.finished_at - self.started_at
-            msg += humanize.precisedelta(elapsed)
+            msg.append(humanize.precisedelta(elapsed))
         else:
-            msg += "---"
-        msg += (
+            msg.append("---")
+        msg.append(
             f"\n{len(self.loads_ids)} load package(s) were loaded to destination"
             f" {self.destination_name} and into dataset {self.dataset_name}\n"
         )
         if self.staging_name:
-            msg += (
+            msg.append(
                 f"The {self.staging_name} staging destination used"
                 f" {self.staging_displayable_credentials} location to stage data\n"
             )
 
-        msg += (
+        msg.append(
             f"The {self.destination_name} destination used"
             f" {self.destination_displayable_credentials} location to store data"
         )
-        msg += self._load_packages_asstr(self.load_packages, verbosity)
+        msg.append(self._load_packages_asstr(self.load_packages, verbosity))
 
-        return msg
+        return "".join(msg)
 
     @property
     def has_failed_jobs(self) -> bool:
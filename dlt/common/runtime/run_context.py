@@ -1,5 +1,6 @@
 import os
 import tempfile
+from functools import lru_cache
 from types import ModuleType
 from typing import Any, ClassVar, Dict, List, Optional
 
@@ -135,7 +136,14 @@ def global_dir() -> str:
     """
     if known_env.DLT_DATA_DIR in os.environ:
         return os.environ[known_env.DLT_DATA_DIR]
+    return _default_global_dir()
 
+
+@lru_cache(maxsize=1)
+def _default_global_dir() -> str:
+    """Resolves default global dir from user id and home directory. Cached for the lifetime of
+    the process as it checks if home directory is writable by creating a temporary file.
+    """
     # geteuid not available on Windows
     if hasattr(os, "geteuid") and os.geteuid() == 0:
         # we are root so use standard /var
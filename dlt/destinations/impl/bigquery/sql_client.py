@@ -1,5 +1,5 @@
 from contextlib import contextmanager
-from typing import Any, AnyStr, ClassVar, Iterator, List, Optional, Sequence, Generator
+from typing import Any, AnyStr, ClassVar, Dict, Iterator, List, Optional, Sequence, Generator
 
 import google.cloud.bigquery as bigquery  # noqa: I250
 from google.api_core import exceptions as api_core_exceptions
@@ -29,15 +29,17 @@ from dlt.common.destination.dataset import DBApiCursor
 
 # terminal reasons as returned in BQ gRPC error response
 # https://cloud.google.com/bigquery/docs/error-messages
-BQ_TERMINAL_REASONS = [
-    "billingTierLimitExceeded",
-    "duplicate",
-    "invalid",
-    "notFound",
-    "notImplemented",
-    "stopped",
-    "tableUnavailable",
-]
+BQ_TERMINAL_REASONS = frozenset(
+    [
+        "billingTierLimitExceeded",
+        "duplicate",
+        "invalid",
+        "notFound",
+        "notImplemented",
+        "stopped",
+        "tableUnavailable",
+    ]
+)
 # invalidQuery is a transient error -> must be fixed by programmer
 
 
@@ -49,6 +51,29 @@ class BigQueryDBApiCursorImpl(DBApiCursorImpl):
     def __init__(self, curr: DBApiCursor) -> None:
         super().__init__(curr)
 
+    def df(self, chunk_size: int = None, **kwargs: Any) -> Optional[DataFrame]:
+        if chunk_size is None:
+            # fetch full result as arrow and convert like iter_df does so dtypes do not depend
+            # on chunk_size
+            table = self.arrow(**kwargs)
+            return table.to_pandas() if table is not None else None
+        return super().df(chunk_size=chunk_size, **kwargs)
+
+    def arrow(self, chunk_size: int = None, **kwargs: Any) -> Optional[ArrowTable]:
+        if chunk_size is None:
+            # fetch full result, not only the first page
+            return self.native_cursor.query_job.to_arrow(**self._bqstorage_kwargs(), **kwargs)
+        return super().arrow(chunk_size=chunk_size, **kwargs)
+
+    def _bqstorage_kwargs(self) -> StrAny:
+        """Reuses storage read client of the dbapi connection. It is None if storage api is not
+        available, in that case we do not try to create it again.
+        """
+        return {
+            "bqstorage_client": self.native_cursor.connection._bqstorage_client,
+            "create_bqstorage_client": False,
+        }
+
     def iter_df(self, chunk_size: int) -> Generator[DataFrame, None, None]:
         yield from self.native_cursor.query_job.result(page_size=chunk_size).to_dataframe_iterable()
 
@@ -71,11 +96,14 @@ class BigQuerySqlClient(SqlClientBase[bigquery.Client], DBTransaction):
         retry_deadline: float = 60.0,
     ) -> None:
         self._client: bigquery.Client = None
+        self._dbapi_conn: DbApiConnection = None
         self.credentials: GcpServiceAccountCredentialsWithoutDefaults = credentials
         self.location = location
         self.project_id = project_id or self.credentials.project_id
         self.http_timeout = http_timeout
         super().__init__(self.project_id, dataset_name, staging_dataset_name, capabilities)
+        # unescaped fully qualified dataset names by dataset name
+        self._fq_dataset_names: Dict[str, str] = {}
 
         self._default_retry = bigquery.DEFAULT_RETRY.with_deadline(retry_deadline)
         self._default_query = bigquery.QueryJobConfig(
@@ -103,11 +131,17 @@ class BigQuerySqlClient(SqlClientBase[bigquery.Client], DBTransaction):
             return query_orig(query, retry=retry, timeout=timeout, **kwargs)
 
         self._client.query = query_patch  # type: ignore
+        # single dbapi connection for all queries, it creates storage api client on init
+        self._dbapi_conn = DbApiConnection(client=self._client)
         return self._client
 
     def close_connection(self) -> None:
         if self._session_query:
             self.rollback_transaction()
+        if self._dbapi_conn:
+            # will close all cursors, client is not closed as it was passed to connection
+            self._dbapi_conn.close()
+            self._dbapi_conn = None
         if self._client:
             self._client.close()
             self._client = None
@@ -212,18 +246,27 @@ class BigQuerySqlClient(SqlClientBase[bigquery.Client], DBTransaction):
     @contextmanager
     @raise_database_error
     def execute_query(self, query: AnyStr, *args: Any, **kwargs: Any) -> Iterator[DBApiCursor]:
-        conn: DbApiConnection = None
+        curr: BQDbApiCursor = None
         db_args = args or (kwargs or None)
         try:
-            conn = DbApiConnection(client=self._client)
-            curr = conn.cursor()
+            curr = self._dbapi_conn.cursor()
             # if session exists give it a preference
             curr.execute(query, db_args, job_config=self._session_query or self._default_query)
             yield BigQueryDBApiCursorImpl(curr)  # type: ignore
         finally:
-            if conn:
-                # will close all cursors
-                conn.close()
+            if curr:
+                curr.close()
+
+    def fully_qualified_dataset_name(self, escape: bool = True, staging: bool = False) -> str:
+        if escape or staging:
+            return super().fully_qualified_dataset_name(escape=escape, staging=staging)
+        # unescaped name is passed to every dataset and query job call, dataset name may be
+        # switched ie. to staging dataset so we cache per dataset name
+        fq_name = self._fq_dataset_names.get(self.dataset_name)
+        if fq_name is None:
+            fq_name = super().fully_qualified_dataset_name(escape=False)
+            self._fq_dataset_names[self.dataset_name] = fq_name
+        return fq_name
 
     def catalog_name(self, escape: bool = True) -> Optional[str]:
         project_id = self.capabilities.casefold_identifier(self.project_id)
@@ -253,21 +296,17 @@ class BigQuerySqlClient(SqlClientBase[bigquery.Client], DBTransaction):
                 return DatabaseTransientException(ex)
         if reason == "notFound":
             return DatabaseUndefinedRelation(ex)
-        if reason == "invalidQuery" and "was not found" in str(ex) and "Dataset" in str(ex):
-            return DatabaseUndefinedRelation(ex)
-        if (
-            reason == "invalidQuery"
-            and "Not found" in str(ex)
-            and ("Dataset" in str(ex) or "Table" in str(ex))
-        ):
-            return DatabaseUndefinedRelation(ex)
-        if reason == "accessDenied" and "Dataset" in str(ex) and "not exist" in str(ex):
+        ex_str = str(ex)
+        if reason == "invalidQuery":
+            if "Dataset" in ex_str and ("was not found" in ex_str or "Not found" in ex_str):
+                return DatabaseUndefinedRelation(ex)
+            if "Not found" in ex_str and "Table" in ex_str:
+                return DatabaseUndefinedRelation(ex)
+            if "Unrecognized name" in ex_str or "cannot be null" in ex_str:
+                # unknown column, inserting NULL into required field
+                return DatabaseTerminalException(ex)
+        if reason == "accessDenied" and "Dataset" in ex_str and "not exist" in ex_str:
             return DatabaseUndefinedRelation(ex)
-        if reason == "invalidQuery" and (
-            "Unrecognized name" in str(ex) or "cannot be null" in str(ex)
-        ):
-            # unknown column, inserting NULL into required field
-            return DatabaseTerminalException(ex)
         if reason in BQ_TERMINAL_REASONS:
             return DatabaseTerminalException(ex)
         # anything else is transient
@@ -575,7 +575,7 @@ class DltResource(Iterable[TDataItem], DltResourceHints):
             pipe_iterator: ManagedPipeIterator = ManagedPipeIterator.from_pipes([self._pipe])  # type: ignore
 
         pipe_iterator.set_context([state_context, section_context])
-        _iter = map(lambda item: item.item, pipe_iterator)
+        _iter = (item.item for item in pipe_iterator)
         return flatten_list_or_items(_iter)
 
     def _set_explicit_args(
@@ -428,7 +428,7 @@ class DltSource(Iterable[TDataItem]):
         with inject_section(section_context), Container().injectable_context(state_context):
             pipe_iterator: ManagedPipeIterator = ManagedPipeIterator.from_pipes(self._resources.selected_pipes)  # type: ignore
         pipe_iterator.set_context([section_context, state_context])
-        _iter = map(lambda item: item.item, pipe_iterator)
+        _iter = (item.item for item in pipe_iterator)
         return flatten_list_or_items(_iter)
 
     def _get_config_section_context(self) -> ConfigSectionContext:
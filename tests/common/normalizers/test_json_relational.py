@@ -45,6 +45,39 @@ def test_flatten_fix_field_name(norm: RelationalNormalizer) -> None:
     ) in lists
 
 
+def test_flatten_preserves_column_order(norm: RelationalNormalizer) -> None:
+    row = {"a": 1, "b": {"c": 2, "d": {"e": 3}, "f": 4}, "g": 5, "h": {"i": 6}}
+    flattened_row, _ = norm._flatten("mock_table", row, 1000)
+    assert list(flattened_row.keys()) == ["a", "b__c", "b__d__e", "b__f", "g", "h__i"]
+
+
+def test_flatten_flat_row(norm: RelationalNormalizer) -> None:
+    row = {"f-1": 1, "": 2, "f 2": None}
+    # first pass normalizes keys, second pass takes fast path for known keys
+    for _ in range(2):
+        flattened_row, lists = norm._flatten("mock_table", row, 1000)
+        assert flattened_row == {"f_1": 1, "_empty": 2, "f_2": None}
+        assert lists == {}
+    # new key in otherwise known row
+    flattened_row, _ = norm._flatten("mock_table", {"f-1": 1, "f!3": 3}, 1000)
+    assert flattened_row == {"f_1": 1, "f_3": 3}
+
+
+def test_normalize_deep_nesting_order(norm: RelationalNormalizer) -> None:
+    row = {"l": [{"m": [1, 2]}, {"m": [3]}], "n": ["x"]}
+    rows = list(norm._normalize_row(row, {}, ("table",), _r_lvl=1000, is_root=True))
+    # rows are yielded depth first in the order of the source data
+    assert [(t[0][0], t[1].get("value")) for t in rows] == [
+        ("table", None),
+        ("table__l", None),
+        ("table__l__m", 1),
+        ("table__l__m", 2),
+        ("table__l", None),
+        ("table__l__m", 3),
+        ("table__n", "x"),
+    ]
+
+
 def test_preserve_json_value(norm: RelationalNormalizer) -> None:
     # add table with json column
     norm.schema.update_table(
@@ -68,6 +101,9 @@ def test_preserve_json_value(norm: RelationalNormalizer) -> None:
     assert flattened_row["value"] == row_2["value"]
     # json value is not flattened
     assert "value__json" not in flattened_row
+    # json value is passed by reference, also when nesting level allows to descend
+    flattened_row, _ = norm._flatten("with_json", row_2, 2)
+    assert flattened_row["value"] is row_2["value"]
 
 
 def test_preserve_json_value_with_hint(norm: RelationalNormalizer) -> None:
@@ -86,6 +122,28 @@ def test_preserve_json_value_with_hint(norm: RelationalNormalizer) -> None:
     assert "value__json" not in flattened_row
 
 
+def test_json_value_after_table_update(norm: RelationalNormalizer) -> None:
+    row = {"value": {"json": True}}
+    flattened_row, _ = norm._flatten("later_json", row, 1000)
+    assert "value__json" in flattened_row
+
+    # updating the table drops cached nested types
+    norm.schema.update_table(
+        new_table(
+            "later_json",
+            columns=[
+                {
+                    "name": "value",
+                    "data_type": "json",
+                    "nullable": "true",  # type: ignore[typeddict-item]
+                }
+            ],
+        )
+    )
+    flattened_row, _ = norm._flatten("later_json", row, 1000)
+    assert flattened_row["value"] == row["value"]
+
+
 def test_nested_table_linking(norm: RelationalNormalizer) -> None:
     row = {"f": [{"l": ["a", "b", "c"], "v": 120, "o": [{"a": 1}, {"a": 2}]}]}
     # request _dlt_root_id propagation
@@ -417,8 +475,7 @@ def test_list_in_list() -> None:
     )
     schema.update_table(path_table)
     assert "zen__webpath" in schema.tables
-    # clear cache with json paths
-    normalize_helpers.is_nested_type.cache_clear()
+    # updated table drops cached json paths in the normalizer
 
     rows = list(schema.normalize_data_item(chats, "1762162.1212", "zen"))
     # both lists are json types now
@@ -470,6 +527,18 @@ def test_child_row_deterministic_hash(norm: RelationalNormalizer) -> None:
     assert all(ch[0][1]["_dlt_id"] != ch[1][1]["_dlt_id"] for ch in zip(children, children_3))
 
 
+def test_row_hash_subset() -> None:
+    row = {"id": 1, "name": "a", "_dlt_load_id": "load_1"}
+    # dlt columns are excluded from the full row hash
+    assert normalize_helpers.get_row_hash(row) == normalize_helpers.get_row_hash(
+        {"name": "a", "id": 1}
+    )
+    # only subset columns present in the row are hashed, order does not matter
+    key_hash = normalize_helpers.get_row_hash(row, subset=["name", "id", "missing"])
+    assert key_hash == normalize_helpers.get_row_hash({"id": 1, "name": "a"}, subset=["id", "name"])
+    assert key_hash != normalize_helpers.get_row_hash(row, subset=["id"])
+
+
 def test_keeps_dlt_id(norm: RelationalNormalizer) -> None:
     h = uniq_id()
     row = {"a": "b", "_dlt_id": h}
@@ -917,7 +986,7 @@ def test_caching_perf(norm: RelationalNormalizer) -> None:
     table["x-normalizer"] = {}
     start = time()
     for _ in range(100000):
-        normalize_helpers.is_nested_type(norm.schema, "test", "field", 0)
+        norm._is_nested_type("test", "field")
         # norm._get_table_nesting_level(norm.schema, "test")
     print(f"{time() - start}")
 
@@ -2,12 +2,20 @@ import os
 from typing import Iterator
 import pytest
 import pickle
+from pytest_mock import MockerFixture
 
 from dlt.common import logger
 from dlt.common.configuration.container import Container
 from dlt.common.configuration.specs import RuntimeConfiguration, PluggableRunContext
 from dlt.common.runtime.init import _INITIALIZED, apply_runtime_config, restore_run_context
-from dlt.common.runtime.run_context import RunContext, get_plugin_modules, is_folder_writable
+from dlt.common.runtime.run_context import (
+    RunContext,
+    get_plugin_modules,
+    DOT_DLT,
+    _default_global_dir,
+    global_dir,
+    is_folder_writable,
+)
 from dlt.common.utils import set_working_dir
 
 from tests.utils import MockableRunContext, TEST_STORAGE_ROOT
@@ -147,3 +155,33 @@ def test_tmp_folder_writable() -> None:
     import tempfile
 
     assert is_folder_writable(tempfile.gettempdir()) is True
+
+
+def test_global_dir_data_dir_override() -> None:
+    default_dir = global_dir()
+    os.environ["DLT_DATA_DIR"] = TEST_STORAGE_ROOT
+    try:
+        # env override is evaluated on each call, default location is resolved once
+        assert global_dir() == TEST_STORAGE_ROOT
+    finally:
+        del os.environ["DLT_DATA_DIR"]
+    assert global_dir() == default_dir
+
+
+def test_global_dir_resolved_once(mocker: MockerFixture) -> None:
+    _default_global_dir.cache_clear()
+    mocker.patch.dict(os.environ)
+    os.environ.pop("DLT_DATA_DIR", None)
+    mocker.patch("os.geteuid", return_value=1000, create=True)
+    expanduser = mocker.patch("os.path.expanduser", return_value=TEST_STORAGE_ROOT)
+    is_writable = mocker.patch(
+        "dlt.common.runtime.run_context.is_folder_writable", return_value=True
+    )
+    try:
+        assert global_dir() == os.path.join(TEST_STORAGE_ROOT, DOT_DLT)
+        assert global_dir() == os.path.join(TEST_STORAGE_ROOT, DOT_DLT)
+        expanduser.assert_called_once_with("~")
+        is_writable.assert_called_once_with(TEST_STORAGE_ROOT)
+    finally:
+        # do not leak mocked location to other tests
+        _default_global_dir.cache_clear()